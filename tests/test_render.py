@@ -0,0 +1,63 @@
+import unittest
+
+from watchout.main import Color, Constants, GameState
+from watchout.render import DrawList, NumpyRenderer, numpy
+
+
+def run_game(frames):
+    """
+    Drives a GameState for frames frames, jumping every 40 frames, and returns
+    the checksum of every frame drawn.
+    """
+    game_state = GameState()
+    renderer = NumpyRenderer(Constants.RESOLUTION)
+    checksums = list()
+    for frame in range(frames):
+        if frame % 40 == 0:
+            game_state.charactor.jump()
+        if not game_state.is_game_over:
+            game_state.update()
+        renderer.draw(game_state.get_draw_list())
+        checksums.append(renderer.checksum())
+    return checksums
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyRendererTest(unittest.TestCase):
+
+    def test_checksums_are_stable(self):
+        checksums = run_game(300)
+        self.assertEqual(checksums, run_game(300))
+        self.assertEqual(checksums[-1], 3688190957)
+
+    def test_rect_is_clipped_at_negative_x(self):
+        renderer = NumpyRenderer((40, 30))
+        draw_list = DrawList(Color.WHITE.value)
+        draw_list.rect(Color.RED.value, -10, 5, 20, 10)
+        renderer.draw(draw_list)
+        self.assertTrue((renderer.framebuffer[5:15, 0:10] == Color.RED.value).all())
+        self.assertTrue((renderer.framebuffer[:, 10:] == Color.WHITE.value).all())
+        self.assertTrue((renderer.framebuffer[0:5] == Color.WHITE.value).all())
+
+    def test_background_cache_is_reused(self):
+        renderer = NumpyRenderer((40, 30))
+        draw_list = DrawList(Color.WHITE.value)
+        draw_list.rect(Color.BLUE.value, 0, 0, 10, 10)
+        renderer.draw(draw_list)
+        checksum = renderer.checksum()
+        background_frame = renderer.background_frame.copy()
+        # A rect from the previous frame must not leak into the next one
+        renderer.draw(DrawList(Color.WHITE.value))
+        self.assertTrue((renderer.framebuffer == Color.WHITE.value).all())
+        self.assertTrue((renderer.background_frame == background_frame).all())
+        renderer.draw(draw_list)
+        self.assertEqual(renderer.checksum(), checksum)
+        # Changing the background refills the cached frame
+        renderer.draw(DrawList(Color.BLACK.value))
+        self.assertTrue((renderer.framebuffer == Color.BLACK.value).all())
+        renderer.draw(draw_list)
+        self.assertEqual(renderer.checksum(), checksum)
+
+
+if __name__ == '__main__':
+    unittest.main()
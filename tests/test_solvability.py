@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from watchout.main import Constants, GameState, Obstacle
+from watchout.solvability import SolvabilityChecker
+
+
+def brute_force(layout):
+    """
+    Tries every jump timing with the real GameState.update and returns True if
+    any of them gets the charactor past all obstacles in layout.
+    """
+    states = {(Constants.ROAD_Y - Constants.CHARACTOR_DIMENSIONS[1], 0, False)}
+    frame = 0
+    while states:
+        if all(obstacle.position[0] + obstacle.dimensions[0] - Constants.SCROLL_SPEED * frame < 0
+               for obstacle in layout):
+            return True
+        next_states = set()
+        for y, velocity, in_jump in states:
+            for jump in (False, True):
+                game_state = GameState()
+                game_state.obstacles.spawn_obstacle = lambda: None
+                for obstacle in layout:
+                    position = [obstacle.position[0] - Constants.SCROLL_SPEED * frame, obstacle.position[1]]
+                    game_state.obstacles.append(Obstacle(obstacle.dimensions, position))
+                charactor = game_state.charactor
+                charactor.position[1] = y
+                charactor.velocity = [0, velocity]
+                charactor.in_jump = in_jump
+                if jump:
+                    charactor.jump()
+                game_state.update()
+                if not game_state.is_game_over:
+                    next_states.add((charactor.position[1], charactor.velocity[1], charactor.in_jump))
+        states = next_states
+        frame += 1
+    return False
+
+
+def random_layout(rng):
+    layout = list()
+    x = 100
+    for _ in range(rng.randint(1, 3)):
+        x += rng.choice([0, 10, 30, 60, 100, 150, 200])
+        height = rng.choice([10, 20, 30, 45, 60])
+        width = rng.choice([5, 20, 60])
+        layout.append(Obstacle((width, height), [x, Constants.ROAD_Y - height]))
+    return layout
+
+
+class SolvabilityCheckerTest(unittest.TestCase):
+
+    PHYSICS = [
+        (1, 15, 5),
+        (1, 12, 7),
+        (2, 20, 4),
+    ]
+
+    def setUp(self):
+        self.constants = (Constants.GRAVITY, Constants.JUMP_VELOCITY, Constants.SCROLL_SPEED)
+
+    def tearDown(self):
+        Constants.GRAVITY, Constants.JUMP_VELOCITY, Constants.SCROLL_SPEED = self.constants
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        checker = SolvabilityChecker()
+        for physics in self.PHYSICS:
+            Constants.GRAVITY, Constants.JUMP_VELOCITY, Constants.SCROLL_SPEED = physics
+            for _ in range(30):
+                layout = random_layout(rng)
+                self.assertEqual(checker.is_solvable(layout), brute_force(layout), (physics, [
+                    (obstacle.position, obstacle.dimensions) for obstacle in layout]))
+
+    def test_advance_clipping(self):
+        checker = SolvabilityChecker()
+        table = checker.get_table()
+        phases = len(table['heights'])
+        for mask in (1, 1 << (phases - 1), 1 << (phases // 2), table['all']):
+            reachable = mask
+            for frames in range(5 * phases):
+                self.assertEqual(checker.advance(table, mask, frames), reachable, (mask, frames))
+                reachable = checker.step(table, reachable)
+
+    def test_last_airborne_phase_is_on_road(self):
+        checker = SolvabilityChecker()
+        table = checker.get_table()
+        ground_y = Constants.ROAD_Y - Constants.CHARACTOR_DIMENSIONS[1]
+        last_phase = 1 << (len(table['heights']) - 1)
+        self.assertEqual(table['heights'][-1], ground_y)
+        obstacle_y1 = Constants.ROAD_Y - Constants.OBSTACLE_DIMENSIONS[1]
+        self.assertFalse(checker.get_safe_phases(table, obstacle_y1, Constants.ROAD_Y) & last_phase)
+        # The charactor is still in the jump, so it can only land next frame
+        self.assertEqual(checker.step(table, last_phase), 1)
+
+    def test_table_ignores_scroll_speed(self):
+        checker = SolvabilityChecker()
+        table = checker.get_table()
+        Constants.SCROLL_SPEED += 1
+        self.assertIs(checker.get_table(), table)
+
+
+if __name__ == '__main__':
+    unittest.main()
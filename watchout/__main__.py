@@ -0,0 +1,6 @@
+from watchout.main import Game
+
+
+if __name__ == '__main__':
+    game = Game()
+    game.start()
@@ -1,5 +1,9 @@
-import pygame
 import enum
+try:
+    from watchout.render import DrawList, PygameRenderer
+except ImportError:
+    # Running as a script from inside the watchout directory
+    from render import DrawList, PygameRenderer
 
 
 class Color(enum.Enum):
@@ -14,6 +18,16 @@ class Color(enum.Enum):
     RED = (255, 0, 0)
 
 
+class Text(enum.Enum):
+
+    """
+    Enumeration for texts shown in game, values are format strings
+    """
+    WATCH_OUT = "Watch out for the bluh-dy rocks!"
+    GAME_OVER = "Game Over Mayte!"
+    SCORE = "Your score: {}"
+
+
 class Constants(object):
 
     """
@@ -22,6 +36,11 @@ class Constants(object):
     GRAVITY = 1
     RESOLUTION = (640, 480)
     ROAD_Y = 400
+    JUMP_VELOCITY = 15
+    SCROLL_SPEED = 5
+    CHARACTOR_X = 50
+    CHARACTOR_DIMENSIONS = (20, 50)
+    OBSTACLE_DIMENSIONS = (20, 30)
 
 
 class GameState(object):
@@ -73,6 +92,28 @@ class GameState(object):
                 self.is_game_over = True
                 break
 
+    def get_draw_list(self):
+        """
+        This method returns a DrawList describing the current game state, to be
+        drawn by a Renderer.
+        """
+        draw_list = DrawList(Color.WHITE.value)
+        if not self.is_game_over:
+            draw_list.text(Text.WATCH_OUT, Color.BLACK.value)
+        else:
+            draw_list.text(Text.GAME_OVER, Color.RED.value)
+        draw_list.text(Text.SCORE, Color.BLUE.value, self.player.score)
+        # Charactor
+        charactor_x, charactor_y = self.charactor.position
+        charactor_w, charactor_h = self.charactor.dimensions
+        draw_list.rect(Color.BLUE.value, charactor_x, charactor_y, charactor_w, charactor_h)
+        # Obstacles
+        for obstacle in self.obstacles:
+            obstacle_x, obstacle_y = obstacle.position
+            obstacle_w, obstacle_h = obstacle.dimensions
+            draw_list.rect(Color.RED.value, obstacle_x, obstacle_y, obstacle_w, obstacle_h)
+        return draw_list
+
 
 class Player(object):
 
@@ -87,12 +128,12 @@ class Player(object):
 class Charactor(object):
 
     """
-    Class to maintain charactor's state.
+    Class to maintain charactor's state. A new charactor stands on the road.
     """
 
     def __init__(self):
-        self.dimensions = None
-        self.position = None
+        self.dimensions = Constants.CHARACTOR_DIMENSIONS
+        self.position = [Constants.CHARACTOR_X, Constants.ROAD_Y - self.dimensions[1]]
         self.in_jump = False
         self.velocity = [0, 0]
 
@@ -103,7 +144,7 @@ class Charactor(object):
         charactor's current velocity and value of Constants.GRAVITY.
         """
         if not self.in_jump:
-            self.velocity = [0, 15]
+            self.velocity = [0, Constants.JUMP_VELOCITY]
             self.in_jump = True
 
     def update(self):
@@ -147,7 +188,7 @@ class Obstacles(list):
         This method spawns new obstacles if required.
         """
         if len(self) == 0 or Constants.RESOLUTION[0] - self[-1].position[0] > 200:
-            obstacle_dim = (20, 30)
+            obstacle_dim = Constants.OBSTACLE_DIMENSIONS
             obstacle_pos = [Constants.RESOLUTION[0], Constants.ROAD_Y - obstacle_dim[1]]
             self.append(Obstacle(obstacle_dim, obstacle_pos))
 
@@ -158,7 +199,7 @@ class Obstacles(list):
         self.spawn_obstacle()
         obstacles_to_be_removed = list()
         for obstacle in self:
-            obstacle.position[0] -= 5
+            obstacle.position[0] -= Constants.SCROLL_SPEED
             if obstacle.position[0] + obstacle.dimensions[0] < 0:
                 obstacles_to_be_removed.append(obstacle)
         for obstacle in obstacles_to_be_removed:
@@ -171,8 +212,9 @@ class Game(object):
     The game class
     """
 
-    def __init__(self):
+    def __init__(self, renderer=None):
         self.restart = True
+        self.renderer = renderer or PygameRenderer(Constants.RESOLUTION, "Watch Out!")
 
     def start(self):
         """
@@ -186,13 +228,13 @@ class Game(object):
         """
         Main method which runs the game.
         """
+        # pygame is only needed for input and timing here, the game logic and
+        # NumpyRenderer can be used without it
+        import pygame
         pygame.init()
         # Initialize game state
         game_state = GameState()
-        game_state.charactor.dimensions = (20, 50)
-        game_state.charactor.position = [50, Constants.ROAD_Y - game_state.charactor.dimensions[1]]
-        screen = pygame.display.set_mode(Constants.RESOLUTION)
-        pygame.display.set_caption("Watch Out!")
+        self.renderer.open()
         clock = pygame.time.Clock()
         done = False
         # Game loop
@@ -217,28 +259,10 @@ class Game(object):
                     game_state.charactor.jump()
                 game_state.update()
             # * Draw on screen
-            screen.fill(Color.WHITE.value)
-            font = pygame.font.SysFont('Calibri', 25, True, False)
-            if not game_state.is_game_over:
-                text = font.render("Watch out for the bluh-dy rocks!", True, Color.BLACK.value)
-            else:
-                text = font.render("Game Over Mayte!", True, Color.RED.value)
-            screen.blit(text, ((screen.get_width() - text.get_width())/2, 50))
-            score_text = font.render("Your score: " + game_state.player.score.__str__(), True, Color.BLUE.value)
-            screen.blit(score_text, ((screen.get_width() - score_text.get_width())/2, score_text.get_height() + 60))
-            # Draw charactor
-            charactor_x, charactor_y = game_state.charactor.position
-            charactor_w, charactor_h = game_state.charactor.dimensions
-            pygame.draw.rect(screen, Color.BLUE.value, [charactor_x, charactor_y, charactor_w, charactor_h], 0)
-            # Draw obstacles
-            for obstacle in game_state.obstacles:
-                obstacle_x, obstacle_y = obstacle.position
-                obstacle_w, obstacle_h = obstacle.dimensions
-                pygame.draw.rect(screen, Color.RED.value, [obstacle_x, obstacle_y, obstacle_w, obstacle_h], 0)
-            # * Refresh screen
-            pygame.display.flip()
+            self.renderer.draw(game_state.get_draw_list())
             # * Set maximum FPS
             clock.tick(60)
+        self.renderer.close()
         pygame.quit()
 
 
@@ -0,0 +1,151 @@
+import zlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DrawList(object):
+
+    """
+    Class to hold everything that has to be drawn in a single frame. Rects are
+    stored as (color, x, y, width, height) tuples and texts as
+    (text_id, color, args) tuples, one text per line from top to bottom.
+    """
+
+    def __init__(self, background):
+        self.background = background
+        self.rects = list()
+        self.texts = list()
+
+    def rect(self, color, x, y, width, height):
+        """
+        This method adds a filled rect to the draw list.
+        """
+        self.rects.append((color, x, y, width, height))
+
+    def text(self, text_id, color, *args):
+        """
+        This method adds a line of text to the draw list. text_id is a member
+        of an enum whose value is a format string for args.
+        """
+        self.texts.append((text_id, color, args))
+
+
+class Renderer(object):
+
+    """
+    Base class for rendering backends.
+    """
+
+    def open(self):
+        """
+        This method prepares the backend for drawing.
+        """
+        pass
+
+    def draw(self, draw_list):
+        """
+        This method draws a single frame from draw_list.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        This method releases any resources held by the backend.
+        """
+        pass
+
+
+class PygameRenderer(Renderer):
+
+    """
+    Renderer which draws on the pygame display.
+    """
+
+    def __init__(self, resolution, caption):
+        self.resolution = resolution
+        self.caption = caption
+        self.pygame = None
+        self.screen = None
+        self.font = None
+
+    def open(self):
+        """
+        This method opens the pygame display and loads the font.
+        """
+        import pygame
+        self.pygame = pygame
+        self.screen = pygame.display.set_mode(self.resolution)
+        pygame.display.set_caption(self.caption)
+        self.font = pygame.font.SysFont('Calibri', 25, True, False)
+
+    def draw(self, draw_list):
+        """
+        This method draws draw_list on the pygame display and refreshes it.
+        """
+        self.screen.fill(draw_list.background)
+        text_y = 50
+        for text_id, color, args in draw_list.texts:
+            text = self.font.render(text_id.value.format(*args), True, color)
+            self.screen.blit(text, ((self.screen.get_width() - text.get_width())/2, text_y))
+            text_y += text.get_height() + 10
+        for color, x, y, width, height in draw_list.rects:
+            self.pygame.draw.rect(self.screen, color, [x, y, width, height], 0)
+        self.pygame.display.flip()
+
+
+class NumpyRenderer(Renderer):
+
+    """
+    Renderer which draws into a NumPy framebuffer of shape (height, width, 3)
+    without needing pygame. Texts have no glyphs here, they are kept in
+    self.texts and included in the frame checksum instead.
+    """
+
+    def __init__(self, resolution):
+        if numpy is None:
+            raise ImportError("NumpyRenderer requires numpy")
+        self.resolution = resolution
+        self.framebuffer = numpy.zeros((resolution[1], resolution[0], 3), dtype=numpy.uint8)
+        self.texts = list()
+        # Broadcasting a color tuple is slow, so colors are converted to arrays
+        # once and the filled background frame is kept to be copied over
+        self.colors = dict()
+        self.background = None
+        self.background_frame = numpy.empty_like(self.framebuffer)
+
+    def get_color(self, color):
+        """
+        This method returns color as a uint8 array, converting it on first use.
+        """
+        if color not in self.colors:
+            self.colors[color] = numpy.array(color, dtype=numpy.uint8)
+        return self.colors[color]
+
+    def draw(self, draw_list):
+        """
+        This method fills the framebuffer with the background and every rect in
+        draw_list, clipping rects to the framebuffer.
+        """
+        width, height = self.resolution
+        if draw_list.background != self.background:
+            self.background = draw_list.background
+            self.background_frame[:] = self.get_color(self.background)
+        numpy.copyto(self.framebuffer, self.background_frame)
+        for color, x, y, w, h in draw_list.rects:
+            x1 = max(int(x), 0)
+            y1 = max(int(y), 0)
+            x2 = min(int(x + w), width)
+            y2 = min(int(y + h), height)
+            if x1 < x2 and y1 < y2:
+                self.framebuffer[y1:y2, x1:x2] = self.get_color(color)
+        self.texts = [(text_id.name, color, args) for text_id, color, args in draw_list.texts]
+
+    def checksum(self):
+        """
+        This method returns a CRC32 checksum of the last frame drawn.
+        """
+        checksum = zlib.crc32(self.framebuffer)
+        return zlib.crc32(repr(self.texts).encode(), checksum)
@@ -0,0 +1,147 @@
+import math
+
+try:
+    from watchout.main import Charactor, Constants
+except ImportError:
+    # Running as a script from inside the watchout directory
+    from main import Charactor, Constants
+
+
+class SolvabilityChecker(object):
+
+    """
+    Class to check whether a sequence of obstacles can be survived with the
+    charactor's jump physics. The charactor's jump phase (number of frames
+    since the jump started, 0 while on the road) is tracked as a bitmask of
+    reachable phases. Reachability tables are memoized per set of jump
+    physics constants and shared across all instances and runs, each holding
+    at most MAX_MEMO_SIZE entries per memo.
+    """
+
+    MAX_JUMP_FRAMES = 1000
+    MAX_MEMO_SIZE = 4096
+    _tables = dict()
+
+    @staticmethod
+    def overlaps(a1, a2, b1, b2):
+        """
+        This method returns True if the ranges [a1, a2] and [b1, b2] overlap,
+        in the same way GameState.check_collision compares edges.
+        """
+        return not (b1 > a2 or b2 < a1)
+
+    def get_table(self):
+        """
+        This method returns the reachability table for the current values in
+        Constants, building it on first use.
+        """
+        key = (Constants.GRAVITY, Constants.ROAD_Y, Constants.JUMP_VELOCITY, Constants.CHARACTOR_DIMENSIONS)
+        if key not in SolvabilityChecker._tables:
+            SolvabilityChecker._tables[key] = self.build_table()
+        return SolvabilityChecker._tables[key]
+
+    def build_table(self):
+        """
+        This method records the charactor's height for every jump phase by
+        running a single jump through Charactor.update.
+        """
+        charactor = Charactor()
+        heights = [charactor.position[1]]
+        charactor.jump()
+        charactor.update()
+        while charactor.in_jump:
+            if len(heights) >= self.MAX_JUMP_FRAMES:
+                raise ValueError("Charactor never lands with the current physics constants")
+            heights.append(charactor.position[1])
+            charactor.update()
+        phases = len(heights)
+        return {
+            'heights': tuple(heights),
+            'all': (1 << phases) - 1,
+            'air': ((1 << phases) - 1) & ~1,
+            'landing': 1 | (1 << (phases - 1)),
+            'safe': dict(),
+            'advance': dict(),
+        }
+
+    @staticmethod
+    def step(table, mask):
+        """
+        This method returns the phases reachable one frame after the phases in
+        mask. A charactor on the road may either stay or jump, a charactor in
+        the air moves on to its next phase and lands after the last one.
+        """
+        reachable = (mask << 1) & table['air']
+        if mask & table['landing']:
+            reachable |= 1
+        return reachable
+
+    def advance(self, table, mask, frames):
+        """
+        This method returns the phases reachable after frames unconstrained
+        frames. From any phase every phase is reachable after twice the jump
+        duration, so frames is clipped to keep the memo table small.
+        """
+        frames = min(frames, 2 * len(table['heights']))
+        key = (mask, frames)
+        if key not in table['advance']:
+            if len(table['advance']) >= self.MAX_MEMO_SIZE:
+                table['advance'].clear()
+            reachable = mask
+            for _ in range(frames):
+                reachable = self.step(table, reachable)
+            table['advance'][key] = reachable
+        return table['advance'][key]
+
+    def get_safe_phases(self, table, obstacle_y1, obstacle_y2):
+        """
+        This method returns the bitmask of phases in which the charactor does
+        not overlap vertically with an obstacle spanning obstacle_y1 to
+        obstacle_y2.
+        """
+        key = (obstacle_y1, obstacle_y2)
+        if key not in table['safe']:
+            if len(table['safe']) >= self.MAX_MEMO_SIZE:
+                table['safe'].clear()
+            charactor_h = Constants.CHARACTOR_DIMENSIONS[1]
+            safe = 0
+            for phase, charactor_y1 in enumerate(table['heights']):
+                if not self.overlaps(charactor_y1, charactor_y1 + charactor_h, obstacle_y1, obstacle_y2):
+                    safe |= 1 << phase
+            table['safe'][key] = safe
+        return table['safe'][key]
+
+    def is_solvable(self, obstacles):
+        """
+        This method returns True if a charactor standing on the road can get
+        past every obstacle in obstacles (a sequence of Obstacle, positioned as
+        they would be at frame 0) by jumping at the right frames.
+        """
+        if Constants.SCROLL_SPEED <= 0:
+            raise ValueError("Constants.SCROLL_SPEED must be positive")
+        table = self.get_table()
+        charactor_x1 = Constants.CHARACTOR_X
+        charactor_x2 = charactor_x1 + Constants.CHARACTOR_DIMENSIONS[0]
+        # Collect the safe phases for every frame in which an obstacle overlaps
+        # the charactor horizontally
+        constraints = dict()
+        for obstacle in obstacles:
+            obstacle_x1 = obstacle.position[0]
+            obstacle_x2 = obstacle_x1 + obstacle.dimensions[0]
+            obstacle_y1 = obstacle.position[1]
+            obstacle_y2 = obstacle_y1 + obstacle.dimensions[1]
+            first_frame = max(1, int(math.ceil((obstacle_x1 - charactor_x2) / Constants.SCROLL_SPEED)))
+            last_frame = int(math.floor((obstacle_x2 - charactor_x1) / Constants.SCROLL_SPEED))
+            safe = self.get_safe_phases(table, obstacle_y1, obstacle_y2)
+            for frame in range(first_frame, last_frame + 1):
+                constraints[frame] = constraints.get(frame, table['all']) & safe
+        # Walk the constrained frames, skipping over the free ones in between
+        mask = 1
+        frame = 0
+        for constrained_frame in sorted(constraints):
+            mask = self.advance(table, mask, constrained_frame - frame - 1)
+            mask = self.step(table, mask) & constraints[constrained_frame]
+            if not mask:
+                return False
+            frame = constrained_frame
+        return True